@@ -1,6 +1,5 @@
 from shi.experimental.arrg import arrg
 from shi.cli import cli, run_cli  # New import
-import json  # New import for JSON parsing
 
 # Global settings for the restaurant
 TAX_RATE = 0.08  # 8% sales tax
@@ -79,17 +78,16 @@ def calculate_item_price(
 def generate_bill(
     customer_name: str,
     table_number: int,
-    items_ordered_json: str,
+    items_ordered: list,
     TAX_RATE: float,
     SERVICE_CHARGE_RATE: float,
 ):
     """
     Generates a bill for the customer.
-    items_ordered_json should be a JSON string representing a list of item dictionaries.
+    items_ordered is a list of item dictionaries; on the command line it is given
+    as a JSON string and parsed by the CLI layer.
     Example CLI call: python restaurant_example.py generate_bill Alice 5 '[{"menu_item": "Pasta Carbonara", "quantity": 2, "base_price": 15.50}]'
     """
-    items_ordered = json.loads(items_ordered_json)  # Parse JSON string
-
     print(f"\n--- Bill for {customer_name} at Table {table_number} ---")
     total_amount = 0
     for item in items_ordered:
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
+import ast
 import inspect
+import json
 import re
 import sys
 import functools
@@ -11,7 +13,18 @@ except ImportError:
     # Fallback for when cli.py is run directly as a script
     import dprint
 
-from typing import Any, Callable, Dict, List, Tuple, get_args, get_origin
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    get_args,
+    get_origin,
+)
 
 try:
     from typing import Literal
@@ -33,19 +46,29 @@ time = None
 money = None
 effort = None
 
+# Accepted spellings of each global argument, keyed by its long name
+global_keys = {
+    "debug": ["debug", "d", "DEBUG", "D"],
+    "time": ["time", "t", "TIME", "T"],
+    "money": ["money", "m", "MONEY", "M"],
+    "effort": ["effort", "e", "EFFORT", "E"],
+}
+global_key_map = {v: long_name for long_name, vs in global_keys.items() for v in vs}
+
+# Patterns are compiled once here rather than looked up on every token
+_global_names = "|".join(global_key_map)
+_GLOBAL_POSTFIX_RE = re.compile(
+    r"^(" + _global_names + r")(\+\+|--|!~~|!~|\+|-|~~~|~~|~)$", re.IGNORECASE
+)
+_GLOBAL_EQUALS_RE = re.compile(r"^(--)?(" + _global_names + r")=(.+)$", re.IGNORECASE)
+_GLOBAL_FLAG_RE = re.compile(r"^(--|-)?(" + _global_names + r")$", re.IGNORECASE)
+_TIME_RE = re.compile(r"^([0-9.]+)\s*([a-zA-Zµ]+)$")
+_LIST_SEPARATOR_RE = re.compile(r",\s*")
+_LOH_SENTINEL_RE = re.compile(r"=[^,\)]*_LOH_SENTINEL[^,\)]*")
 
-def extract_global_args_from_list(argv: List[str]) -> Tuple[Dict[str, Any], List[str]]:
-    global_keys = {
-        "debug": ["debug", "d", "DEBUG", "D"],
-        "time": ["time", "t", "TIME", "T"],
-        "money": ["money", "m", "MONEY", "M"],
-        "effort": ["effort", "e", "EFFORT", "E"],
-    }
-    key_map = {}
-    for long_name, variations in global_keys.items():
-        for v in variations:
-            key_map[v] = long_name
 
+def extract_global_args_from_list(argv: List[str]) -> Tuple[Dict[str, Any], List[str]]:
+    key_map = global_key_map
     raw_globals = {}
     clean_argv = []
     i = 0
@@ -54,11 +77,7 @@ def extract_global_args_from_list(argv: List[str]) -> Tuple[Dict[str, Any], List
         arg = argv[i]
 
         # 1. Check for postfix operators
-        postfix_match = re.match(
-            r"^(" + "|".join(key_map.keys()) + r")(\+\+|--|!~~|!~|\+|-|~~~|~~|~)$",
-            arg,
-            re.IGNORECASE,
-        )
+        postfix_match = _GLOBAL_POSTFIX_RE.match(arg)
         if postfix_match:
             key, op = postfix_match.groups()
             norm_key = key_map[key.lower()]
@@ -72,9 +91,7 @@ def extract_global_args_from_list(argv: List[str]) -> Tuple[Dict[str, Any], List
             continue
 
         # 2. Check for key=value format (with or without leading --)
-        eq_match = re.match(
-            r"^(--)?(" + "|".join(key_map.keys()) + r")=(.+)$", arg, re.IGNORECASE
-        )
+        eq_match = _GLOBAL_EQUALS_RE.match(arg)
         if eq_match:
             _, key, val = eq_match.groups()
             norm_key = key_map[key.lower()]
@@ -83,9 +100,7 @@ def extract_global_args_from_list(argv: List[str]) -> Tuple[Dict[str, Any], List
             continue
 
         # 3. Check for standalone --key or -key
-        flag_match = re.match(
-            r"^(--|-)?(" + "|".join(key_map.keys()) + r")$", arg, re.IGNORECASE
-        )
+        flag_match = _GLOBAL_FLAG_RE.match(arg)
         if flag_match:
             _, key = flag_match.groups()
             norm_key = key_map[key.lower()]
@@ -147,7 +162,7 @@ def normalize_time(val: Any) -> Any:
     if val_str == "true":
         return True
 
-    match = re.match(r"^([0-9.]+)\s*([a-zA-Zµ]+)$", val_str)
+    match = _TIME_RE.match(val_str)
     if match:
         num_str, unit = match.groups()
         try:
@@ -322,12 +337,6 @@ def inject_globals(
     has_kwargs = any(
         p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values()
     )
-    global_keys = {
-        "debug": ["debug", "d", "DEBUG", "D"],
-        "time": ["time", "t", "TIME", "T"],
-        "money": ["money", "m", "MONEY", "M"],
-        "effort": ["effort", "e", "EFFORT", "E"],
-    }
     for g_name, val in normalized_globals.items():
         variations = global_keys[g_name]
         for var in variations:
@@ -354,6 +363,59 @@ def _register_aliases():
     cli_commands.update(aliases)
 
 
+def parse_int(value_str: str) -> int:
+    """Parse a decimal or 0x/0o/0b-prefixed integer, raising ValueError."""
+    try:
+        return int(value_str, 0)
+    except ValueError:
+        # Base 0 rejects decimals with leading zeros such as "007"
+        return int(value_str, 10)
+
+
+_truthy_strings = frozenset(("true", "1", "t", "y", "yes", "+", "++"))
+
+
+def _convert_bool(value_str: str) -> bool:
+    return value_str.lower() in _truthy_strings
+
+
+def _convert_int(value_str: str) -> Any:
+    try:
+        return parse_int(value_str)
+    except ValueError:
+        try:
+            return int(value_str, 16)
+        except ValueError:
+            return value_str  # Fallback to string if int conversion fails
+
+
+def _convert_float(value_str: str) -> Any:
+    try:
+        return float(value_str)
+    except ValueError:
+        return value_str  # Fallback to string if float conversion fails
+
+
+def _convert_json(value_str: str, target_type: type) -> Any:
+    """Bare list/dict annotations take a JSON document."""
+    try:
+        value = json.loads(value_str)
+    except ValueError:
+        return value_str  # Fallback to string if it is not valid JSON
+    return value if isinstance(value, target_type) else value_str
+
+
+# Plain annotations are dispatched with one lookup instead of an if/elif ladder
+_plain_converters: Dict[type, Callable[[str], Any]] = {
+    bool: _convert_bool,
+    int: _convert_int,
+    float: _convert_float,
+    str: str,
+    list: functools.partial(_convert_json, target_type=list),
+    dict: functools.partial(_convert_json, target_type=dict),
+}
+
+
 def convert_value(value_str: str, target_type: Any) -> Any:
     """Attempt to convert a string value to a target type.
 
@@ -363,18 +425,18 @@ def convert_value(value_str: str, target_type: Any) -> Any:
     if isinstance(value_str, bool):
         return value_str
 
+    if isinstance(target_type, type):
+        converter = _plain_converters.get(target_type)
+        if converter is not None:
+            return converter(value_str)
+
     if target_type is inspect.Parameter.empty:
         if value_str in ("+", "++", "True", "true"):
             return True
         if value_str in ("-", "--", "False", "false"):
             return False
         try:
-            return int(value_str, 10)
-        except ValueError:
-            pass
-        try:
-            if value_str.startswith("0x"):
-                return int(value_str, 16)
+            return parse_int(value_str)
         except ValueError:
             pass
         try:
@@ -387,8 +449,8 @@ def convert_value(value_str: str, target_type: Any) -> Any:
             or (value_str.startswith("{") and value_str.endswith("}"))
         ):
             try:
-                return eval(value_str)
-            except Exception:
+                return ast.literal_eval(value_str)
+            except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
                 pass
         return value_str  # Fallback if no conversion works
 
@@ -429,27 +491,10 @@ def convert_value(value_str: str, target_type: Any) -> Any:
         )
         sys.exit(1)
 
-    if target_type is bool:
-        return value_str.lower() in ("true", "1", "t", "y", "yes", "+", "++")
-    if target_type is int:
-        try:
-            return int(value_str, 10)
-        except ValueError:
-            try:
-                return int(value_str, 16)
-            except ValueError:
-                return value_str  # Fallback to string if int conversion fails
-    elif target_type is float:
-        try:
-            return float(value_str)
-        except ValueError:
-            return value_str  # Fallback to string if float conversion fails
-    elif target_type is str:
-        return value_str
     # Handle list types
-    elif getattr(target_type, "__origin__", None) is list:
+    if getattr(target_type, "__origin__", None) is list:
         item_type = target_type.__args__[0]
-        items = re.split(r",\s*", value_str)
+        items = _LIST_SEPARATOR_RE.split(value_str)
         return [convert_value(item, item_type) for item in items]
     return value_str
 
@@ -464,6 +509,138 @@ def is_unannotated_none_default(param: inspect.Parameter) -> bool:
     return param.annotation is inspect.Parameter.empty and param.default is None
 
 
+def infer_keyword_type(param: inspect.Parameter) -> Any:
+    """Return the type a keyword value for param converts to.
+
+    Unannotated parameters take the type of their default, if it has one.
+    """
+    target_type = param.annotation
+    if target_type is inspect.Parameter.empty:
+        if is_bool_parameter(param):
+            target_type = bool
+        elif param.default is not inspect.Parameter.empty and param.default is not None:
+            if isinstance(param.default, str):
+                target_type = str
+            elif isinstance(param.default, int):
+                target_type = int
+            elif isinstance(param.default, float):
+                target_type = float
+    return target_type
+
+
+class CommandSignature(NamedTuple):
+    """The parts of a command's signature that argument parsing needs."""
+
+    sig: inspect.Signature
+    param_names: FrozenSet[str]
+    # Parameters that a bare --flag or a flag+/flag- postfix switches on or off
+    flag_names: FrozenSet[str]
+    param_map: Dict[str, str]
+    # Conversion target for each parameter passed by keyword
+    keyword_types: Dict[str, Any]
+    # Annotation of each positional parameter, by position
+    positional_types: Tuple[Any, ...]
+    var_positional_param: Optional[inspect.Parameter]
+    # Annotation of the *args parameter, if there is one
+    var_positional_type: Any
+    has_var_keyword: bool
+
+
+def get_command_signature(func: Callable) -> CommandSignature:
+    """Compute a command's signature once and reuse it for every dispatch."""
+    try:
+        return _cached_command_signature(func)
+    except TypeError:
+        # Unhashable callables cannot be cached
+        return _compute_command_signature(func)
+
+
+def _compute_command_signature(func: Callable) -> CommandSignature:
+    """Build a command's CommandSignature without caching it."""
+    sig = inspect.signature(func)
+    params = sig.parameters.values()
+    positional_params = tuple(
+        p
+        for p in params
+        if p.kind
+        in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    )
+    var_positional_param = next(
+        (p for p in params if p.kind == inspect.Parameter.VAR_POSITIONAL), None
+    )
+    return CommandSignature(
+        sig=sig,
+        param_names=frozenset(sig.parameters),
+        flag_names=frozenset(
+            p.name
+            for p in params
+            if is_bool_parameter(p) or is_unannotated_none_default(p)
+        ),
+        param_map={normalize_arg_name(p): p for p in sig.parameters},
+        keyword_types={p.name: infer_keyword_type(p) for p in params},
+        positional_types=tuple(p.annotation for p in positional_params),
+        var_positional_param=var_positional_param,
+        var_positional_type=(
+            var_positional_param.annotation if var_positional_param else None
+        ),
+        has_var_keyword=any(p.kind == inspect.Parameter.VAR_KEYWORD for p in params),
+    )
+
+
+# Bounded so that dynamically created commands are not kept alive forever
+_cached_command_signature = functools.lru_cache(maxsize=256)(_compute_command_signature)
+
+
+def _is_word(s: str) -> bool:
+    """Return True if s is non-empty and contains no whitespace."""
+    return s.split() == [s]
+
+
+def split_long_option(arg_str: str) -> Optional[Tuple[str, Optional[str]]]:
+    """Split --key or --key=value into (key, value), or return None."""
+    if not arg_str.startswith("--"):
+        return None
+    key, eq, value_str = arg_str[2:].partition("=")
+    if not _is_word(key) or (eq and not value_str):
+        return None
+    return key, value_str if eq else None
+
+
+def split_key_value(arg_str: str) -> Optional[Tuple[str, str]]:
+    """Split key=value into (key, value), or return None."""
+    key, eq, value_str = arg_str.partition("=")
+    if not eq or not value_str or not _is_word(key):
+        return None
+    return key, value_str
+
+
+def split_postfix_op(arg_str: str) -> Optional[Tuple[str, str]]:
+    """Split a Loh postfix operator such as key+ or key~~ into (key, op)."""
+    if arg_str.endswith("++"):
+        op = "++"
+    elif arg_str.endswith(("+", "-")):
+        # Names may contain dashes, so a trailing "--" is the name's own
+        # dash followed by "-"
+        op = arg_str[-1]
+    elif arg_str.endswith("~"):
+        op = arg_str[len(arg_str.rstrip("~")) :]
+        if len(op) > 3:
+            return None
+        if arg_str[: -len(op)].endswith("!") and len(op) < 3:
+            op = "!" + op
+    else:
+        return None
+    key = arg_str[: -len(op)]
+    if (
+        not key
+        or key[0] == "-"
+        or not key.isascii()
+        or not key.replace("-", "_").isidentifier()
+    ):
+        return None
+    return key, op
+
+
 def parse_cli_args(func: Callable, cli_args_raw: List[str]) -> inspect.BoundArguments:
     """Parse command-line arguments for a given function and return BoundArguments.
 
@@ -471,16 +648,20 @@ def parse_cli_args(func: Callable, cli_args_raw: List[str]) -> inspect.BoundArgu
     key++, key--), and positional args with basic type conversion.
     """
 
-    sig = inspect.signature(func)
-    param_map = {normalize_arg_name(p): p for p in sig.parameters}
+    command_sig = get_command_signature(func)
+    sig = command_sig.sig
+    param_map = command_sig.param_map
+    param_names = command_sig.param_names
+    flag_names = command_sig.flag_names
+    keyword_types = command_sig.keyword_types
     raw_args: List[str] = []
     raw_kwargs: Dict[str, Any] = {}
 
     i = 0
     while i < len(cli_args_raw):
         arg_str = cli_args_raw[i]
-        if match := re.match(r"^--([^=\s]+)(=(.+))?$", arg_str):
-            key, _, value_str = match.groups()
+        if long_option := split_long_option(arg_str):
+            key, value_str = long_option
 
             # Handle --no-<flag>
             is_no_flag = False
@@ -499,14 +680,7 @@ def parse_cli_args(func: Callable, cli_args_raw: List[str]) -> inspect.BoundArgu
                     raw_kwargs[actual_key] = False
             else:
                 if value_str is None:
-                    is_bool = False
-                    if actual_key in sig.parameters:
-                        param = sig.parameters[actual_key]
-                        is_bool = is_bool_parameter(
-                            param
-                        ) or is_unannotated_none_default(param)
-
-                    if is_bool:
+                    if actual_key in flag_names:
                         raw_kwargs[actual_key] = True
                     else:
                         # Peek at next arg
@@ -515,7 +689,10 @@ def parse_cli_args(func: Callable, cli_args_raw: List[str]) -> inspect.BoundArgu
                             if (
                                 next_arg.startswith("-")
                                 or "=" in next_arg
-                                or re.match(r"^.+(\+\+|--|\+|-|~~|~)$", next_arg)
+                                or (
+                                    len(next_arg) > 1
+                                    and next_arg.endswith(("+", "-", "~"))
+                                )
                             ):
                                 raw_kwargs[actual_key] = True
                             else:
@@ -526,26 +703,19 @@ def parse_cli_args(func: Callable, cli_args_raw: List[str]) -> inspect.BoundArgu
                 else:
                     raw_kwargs[actual_key] = value_str
             i += 1
-        elif match := re.match(r"^([^=\s]+)=(.+)$", arg_str):
-            key, value_str = match.groups()
+        elif key_value := split_key_value(arg_str):
+            key, value_str = key_value
             actual_key = param_map.get(normalize_arg_name(key), key.replace("-", "_"))
             raw_kwargs[actual_key] = value_str
             i += 1
-        elif match := re.match(
-            r"^([a-zA-Z_][a-zA-Z0-9_\-]*)(\+\+|--|!~~|!~|\+|-|~~~|~~|~)$", arg_str
-        ):
+        elif postfix_op := split_postfix_op(arg_str):
             # Handle Loh postfix operators
-            key, op = match.groups()
+            key, op = postfix_op
             actual_key = param_map.get(normalize_arg_name(key), key.replace("-", "_"))
             is_valid_op = True
             if op in ("+", "++", "-", "--"):
-                if actual_key in sig.parameters:
-                    param = sig.parameters[actual_key]
-                    if param.annotation != bool and not (
-                        param.annotation == inspect.Parameter.empty
-                        and (isinstance(param.default, bool) or param.default is None)
-                    ):
-                        is_valid_op = False
+                if actual_key in param_names and actual_key not in flag_names:
+                    is_valid_op = False
 
             if is_valid_op:
                 if op in ("+", "++"):
@@ -564,30 +734,17 @@ def parse_cli_args(func: Callable, cli_args_raw: List[str]) -> inspect.BoundArgu
             i += 1
 
     # Convert types based on signature
-    positional_params = [
-        p
-        for p in sig.parameters.values()
-        if p.kind
-        in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
-    ]
-    var_positional_param = next(
-        (
-            p
-            for p in sig.parameters.values()
-            if p.kind == inspect.Parameter.VAR_POSITIONAL
-        ),
-        None,
-    )
+    positional_types = command_sig.positional_types
+    n_positional = len(positional_types)
+    var_positional_param = command_sig.var_positional_param
+    var_positional_type = command_sig.var_positional_type
 
     converted_args = []
     for i, arg_str in enumerate(raw_args):
-        if i < len(positional_params):
-            param = positional_params[i]
-            converted_args.append(convert_value(arg_str, param.annotation))
+        if i < n_positional:
+            converted_args.append(convert_value(arg_str, positional_types[i]))
         elif var_positional_param:
-            converted_args.append(
-                convert_value(arg_str, var_positional_param.annotation)
-            )
+            converted_args.append(convert_value(arg_str, var_positional_type))
         else:
             converted_args.append(arg_str)
 
@@ -595,35 +752,17 @@ def parse_cli_args(func: Callable, cli_args_raw: List[str]) -> inspect.BoundArgu
     for key, val in raw_kwargs.items():
         if isinstance(val, bool) or val is None:
             converted_kwargs[key] = val
-        elif key in sig.parameters:
-            param = sig.parameters[key]
-            # Infer target_type from default if annotation is empty
-            target_type = param.annotation
-            if target_type is inspect.Parameter.empty:
-                if is_bool_parameter(param):
-                    target_type = bool
-                elif (
-                    param.default is not inspect.Parameter.empty
-                    and param.default is not None
-                ):
-                    if isinstance(param.default, str):
-                        target_type = str
-                    elif isinstance(param.default, int):
-                        target_type = int
-                    elif isinstance(param.default, float):
-                        target_type = float
-            converted_kwargs[key] = convert_value(val, target_type)
+        elif key in param_names:
+            converted_kwargs[key] = convert_value(val, keyword_types[key])
         else:
             converted_kwargs[key] = convert_value(val, inspect.Parameter.empty)
 
     # Separate bindable kwargs from extra kwargs
-    has_var_keyword = any(
-        p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values()
-    )
+    has_var_keyword = command_sig.has_var_keyword
     bind_kwargs = {}
     extra_kwargs = {}
     for key, val in converted_kwargs.items():
-        if key in sig.parameters or has_var_keyword:
+        if key in param_names or has_var_keyword:
             bind_kwargs[key] = val
         else:
             extra_kwargs[key] = val
@@ -648,49 +787,7 @@ def normalize_arg_name(name: str) -> str:
 
 
 def check_argument_collisions(func: Callable):
-    sig = inspect.signature(func)
-    normalized_names = {}
-    for param_name in sig.parameters:
-        param = sig.parameters[param_name]
-        if param.kind in (
-            inspect.Parameter.VAR_POSITIONAL,
-            inspect.Parameter.VAR_KEYWORD,
-        ):
-            continue
-        norm_name = normalize_arg_name(param_name)
-        if norm_name in normalized_names:
-            raise ValueError(
-                f"Argument collision detected in command '{func.__name__}': "
-                f"'{param_name}' and '{normalized_names[norm_name]}' both normalize to '{norm_name}'"
-            )
-        normalized_names[norm_name] = param_name
-
-
-def check_command_collision(new_name: str):
-    norm_new = normalize_command_name(
-        new_name, case_insensitive=True, normalize_separators=True
-    )
-    for registered_name in cli_commands:
-        norm_reg = normalize_command_name(
-            registered_name, case_insensitive=True, normalize_separators=True
-        )
-        if norm_new == norm_reg:
-            raise ValueError(
-                f"Command collision detected: '{new_name}' and '{registered_name}' "
-                f"both normalize to '{norm_new}'"
-            )
-
-
-class CliDecorator:
-    """Decorator to register a function, module, or class, with support for dynamic attribute access to registered commands."""
-
-
-def normalize_arg_name(name: str) -> str:
-    return name.lower().replace("-", "").replace("_", "")
-
-
-def check_argument_collisions(func: Callable):
-    sig = inspect.signature(func)
+    sig = get_command_signature(func).sig
     normalized_names = {}
     for param_name in sig.parameters:
         param = sig.parameters[param_name]
@@ -709,7 +806,7 @@ def check_argument_collisions(func: Callable):
 
 
 def normalize_command_name(
-    name: str, case_insensitive: bool, normalize_separators: bool
+    name: str, case_insensitive: bool = True, normalize_separators: bool = True
 ) -> str:
     if case_insensitive:
         name = name.lower()
@@ -844,16 +941,6 @@ def __getattr__(name: str) -> Any:
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
-def normalize_command_name(
-    name: str, case_insensitive: bool = True, normalize_separators: bool = True
-) -> str:
-    if case_insensitive:
-        name = name.lower()
-    if normalize_separators:
-        name = name.replace("-", "_")
-    return name
-
-
 def show_command_help(cmd_name: str):
     _register_aliases()
     if cmd_name not in cli_commands:
@@ -863,9 +950,9 @@ def show_command_help(cmd_name: str):
         show_usage(exit_code=1)
 
     wrapped_func, original_func = cli_commands[cmd_name]
-    sig = inspect.signature(original_func)
+    sig = get_command_signature(original_func).sig
     sig_str = str(sig)
-    sig_str = re.sub(r"=[^,\)]*_LOH_SENTINEL[^,\)]*", "=~", sig_str)
+    sig_str = _LOH_SENTINEL_RE.sub("=~", sig_str)
     console.print(
         f"[bold magenta]Command:[/bold magenta] [bold green]{escape(cmd_name)}[/bold green]"
     )
@@ -894,9 +981,9 @@ def show_usage(exit_code: int = 1):
     console.print(f"       {escape(sys.argv[0])} <command> ... ?   (for command help)")
     console.print(f"[bold magenta]Available commands:[/bold magenta]")
     for cmd_name, (wrapped_func, original_func) in cli_commands.items():
-        sig = inspect.signature(original_func)
+        sig = get_command_signature(original_func).sig
         sig_str = str(sig)
-        sig_str = re.sub(r"=[^,\)]*_LOH_SENTINEL[^,\)]*", "=~", sig_str)
+        sig_str = _LOH_SENTINEL_RE.sub("=~", sig_str)
         console.print(f"  [bold green]{escape(cmd_name)}[/bold green]{escape(sig_str)}")
     sys.exit(exit_code)
 
@@ -936,16 +1023,25 @@ def run_cli(
         else:
             show_command_help(clean_argv[0])
 
+    # An exact match is a single dict lookup; only a miss needs every
+    # registered name normalized and compared
     command_name = clean_argv[0]
     matched_cmd_name = None
-    for registered_name in cli_commands:
-        if normalize_command_name(
-            registered_name, case_insensitive, normalize_separators
-        ) == normalize_command_name(
+    if command_name in cli_commands:
+        matched_cmd_name = command_name
+    else:
+        normalized_command_name = normalize_command_name(
             command_name, case_insensitive, normalize_separators
-        ):
-            matched_cmd_name = registered_name
-            break
+        )
+        for registered_name in cli_commands:
+            if (
+                normalize_command_name(
+                    registered_name, case_insensitive, normalize_separators
+                )
+                == normalized_command_name
+            ):
+                matched_cmd_name = registered_name
+                break
 
     if matched_cmd_name is None:
         console.print(
@@ -960,8 +1056,9 @@ def run_cli(
         print(f"Error parsing arguments for '{matched_cmd_name}': {e}")
         sys.exit(1)
 
-    sig = inspect.signature(original_func)
-    if debug and "debug" in sig.parameters and "debug" not in bound.arguments:
+    command_sig = get_command_signature(original_func)
+    sig = command_sig.sig
+    if debug and "debug" in command_sig.param_names and "debug" not in bound.arguments:
         bound.arguments["debug"] = True
 
     # Normalize and inject global arguments
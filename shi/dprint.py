@@ -3,15 +3,43 @@ dprint - A debug print library with runtime reflection
 Provides human-readable debugging output with variable names, types, and values.
 """
 
+import ast
+import functools
 import inspect
 import sys
 import gc
+import linecache
+import os
+import weakref
 from typing import Any
-from pathlib import Path
 from rich.console import Console
+from rich.pretty import pretty_repr
 
 console = Console()
 
+
+def _disabled_by_env() -> bool:
+    """Whether DPRINT_DISABLE is set to a true value such as 1 or yes."""
+    value = os.environ.get("DPRINT_DISABLE", "")
+    return value.strip().lower() not in ("", "0", "false", "no", "off")
+
+
+# Setting DPRINT_DISABLE turns every dprint call into an immediate return
+_enabled = not _disabled_by_env()
+
+
+def enable():
+    """Turn dprint output on."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Turn dprint output off, skipping all frame inspection."""
+    global _enabled
+    _enabled = False
+
+
 def dprint(*args, hide_wrappers=True, **kwargs):
     """
     Debug print with runtime reflection.
@@ -32,66 +60,35 @@ def dprint(*args, hide_wrappers=True, **kwargs):
             # example.py:10 main()
             #   x: int = 42
     """
-    # Get the caller's frame
-    frame = inspect.currentframe()
-    if frame is None:
-        print("dprint: Unable to get frame information")
+    if not _enabled:
         return
 
+    # Get the caller's frame
     try:
-        caller_frame = frame.f_back
-        if caller_frame is None:
-            print("dprint: Unable to get caller frame")
-            return
+        caller_frame = sys._getframe(1)
+    except ValueError:
+        print("dprint: Unable to get caller frame")
+        return
 
-        # Extract caller information
-        filename = caller_frame.f_code.co_filename
-        line_number = caller_frame.f_lineno
+    # No try/finally del: caller_frame is only referenced from this frame,
+    # which CPython frees on return, and dprint never keeps a traceback
+    # Extract caller information
+    filename = caller_frame.f_code.co_filename
+    line_number = caller_frame.f_lineno
 
+    # Buffer everything so the whole dump is written to stdout at once
+    with console:
         # Print backtrace
         depth = _print_backtrace(caller_frame, hide_wrappers=hide_wrappers)
 
         # If no arguments, dump all local variables from caller's scope
         if not args and not kwargs:
-            for var_name, var_value in caller_frame.f_locals.items():
-                if not var_name.startswith("_"):
-                    type_name = type(var_value).__name__
-                    _print_variable(var_name, type_name, var_value, depth)
+            _print_locals(caller_frame, depth)
             return
 
         # For positional arguments, try to extract variable names
         if args:
-            # Get the source code line
-            try:
-                import linecache
-
-                source_line = linecache.getline(filename, line_number).strip()
-
-                # Extract the argument expressions from the source
-                # This is a simplified parser - looks for content between dprint()
-                if "dprint(" in source_line:
-                    start = source_line.index("dprint(") + 7
-                    # Find matching closing paren
-                    paren_count = 1
-                    end = start
-                    for i, char in enumerate(source_line[start:], start):
-                        if char == "(":
-                            paren_count += 1
-                        elif char == ")":
-                            paren_count -= 1
-                            if paren_count == 0:
-                                end = i
-                                break
-
-                    args_str = source_line[start:end]
-                    # Split by commas (simple split, doesn't handle nested structures perfectly)
-                    var_names = [
-                        arg.strip() for arg in args_str.split(",") if arg.strip()
-                    ]
-                else:
-                    var_names = [f"arg{i}" for i in range(len(args))]
-            except:
-                var_names = [f"arg{i}" for i in range(len(args))]
+            var_names = _extract_arg_names(filename, line_number, len(args))
 
             # Print each positional argument
             for i, (value, name) in enumerate(zip(args, var_names)):
@@ -103,105 +100,244 @@ def dprint(*args, hide_wrappers=True, **kwargs):
             type_name = type(value).__name__
             _print_variable(key, type_name, value, depth)
 
-    finally:
-        # Clean up frame references to avoid reference cycles
-        del frame
-        if "caller_frame" in locals():
-            del caller_frame
+
+# Longest dprint() call, in source lines, that argument names are parsed from
+_MAX_CALL_LINES = 10
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_arg_names(filename: str, line_number: int, n_args: int) -> tuple:
+    """
+    Extract the argument expressions of the dprint() call on a source line.
+
+    Cached per call site, since the source does not change while running.
+    """
+    try:
+        lines = linecache.getlines(filename)
+        source_line = lines[line_number - 1].strip()
+        if "dprint(" in source_line:
+            var_names = _parse_arg_names(lines, line_number)
+            if var_names is None:
+                var_names = _scan_arg_names(source_line)
+            return var_names
+    except:
+        pass
+    return tuple(f"arg{i}" for i in range(n_args))
+
+
+def _parse_arg_names(lines: list, line_number: int):
+    """
+    Get the dprint() argument expressions by parsing the source with ast.
+
+    A call split over several lines is parsed by joining the lines that
+    follow until the snippet is valid Python. Returns None if no snippet of
+    up to _MAX_CALL_LINES lines parses.
+    """
+    source = lines[line_number - 1].strip()
+    following = iter(lines[line_number : line_number + _MAX_CALL_LINES - 1])
+    while True:
+        try:
+            tree = ast.parse(source)
+            break
+        except SyntaxError:
+            next_line = next(following, None)
+            if next_line is None:
+                return None
+            source += "\n" + next_line.strip()
+
+    calls = [
+        node
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call)
+        and getattr(node.func, "id", getattr(node.func, "attr", None)) == "dprint"
+    ]
+    if not calls:
+        return None
+    # The snippet starts on the calling line, so the first call in source
+    # order is the one being made
+    call = min(calls, key=lambda node: (node.lineno, node.col_offset))
+    return tuple(ast.get_source_segment(source, arg) for arg in call.args)
+
+
+def _scan_arg_names(source_line: str) -> tuple:
+    """Fallback for lines ast cannot parse, such as a call split over lines."""
+    start = source_line.index("dprint(") + 7
+    # Find matching closing paren
+    paren_count = 1
+    end = start
+    for i, char in enumerate(source_line[start:], start):
+        if char == "(":
+            paren_count += 1
+        elif char == ")":
+            paren_count -= 1
+            if paren_count == 0:
+                end = i
+                break
+
+    args_str = source_line[start:end]
+    # Split by commas (simple split, doesn't handle nested structures perfectly)
+    return tuple(arg.strip() for arg in args_str.split(",") if arg.strip())
+
+
+@functools.lru_cache(maxsize=512)
+def _short_filename(filename: str) -> str:
+    """Base name of a source file, as shown in the backtrace."""
+    return os.path.basename(filename)
+
+
+def _code_arg_names(code) -> tuple:
+    """Names of a code object's parameters, as inspect.getargvalues lists them."""
+    return code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+
+
+# What the backtrace needs to know about each code object's function,
+# computed once per code object and dropped along with it
+_function_info_cache = weakref.WeakKeyDictionary()
+
+
+def _match_code(func: Any, code) -> Any:
+    """Return func, or the function it wraps, if it runs code."""
+    while func is not None:
+        if getattr(func, "__code__", None) is code:
+            return func
+        func = getattr(func, "__wrapped__", None)
+    return None
+
+
+def _find_function(frame) -> Any:
+    """
+    Find the function object running in frame.
+
+    Module-level functions are found by name in the frame's globals, and
+    methods on the class of their first argument. Only when both fail (for
+    example for nested functions) is the heap scanned with gc.get_referrers.
+    """
+    code = frame.f_code
+    func_obj = _match_code(frame.f_globals.get(code.co_name), code)
+    if func_obj is not None:
+        return func_obj
+
+    if code.co_argcount and code.co_varnames[0] in frame.f_locals:
+        first_arg = frame.f_locals[code.co_varnames[0]]
+        owner = first_arg if isinstance(first_arg, type) else type(first_arg)
+        for klass in owner.__mro__:
+            attr = vars(klass).get(code.co_name)
+            func_obj = _match_code(getattr(attr, "__func__", attr), code)
+            if func_obj is not None:
+                return func_obj
+
+    return next(
+        (f for f in gc.get_referrers(code) if inspect.isfunction(f)),
+        None,
+    )
+
+
+def _function_info(frame) -> tuple:
+    """
+    Return whether the function running in frame is a wrapper (has
+    __wrapped__), and its dotted qualname split into parts, or None for a
+    plain top-level name.
+    """
+    code = frame.f_code
+    info = _function_info_cache.get(code)
+    if info is None:
+        func_obj = _find_function(frame)
+        if func_obj is None:
+            info = (False, None)
+        else:
+            qualname = func_obj.__qualname__
+            qualname_parts = tuple(qualname.split(".")) if "." in qualname else None
+            info = (hasattr(func_obj, "__wrapped__"), qualname_parts)
+        _function_info_cache[code] = info
+    return info
+
+
+# Indentation for each call graph level, 3 spaces per level
+_INDENTS = tuple("   " * level for level in range(64))
+
+
+def _indent(level: int) -> str:
+    """Indentation for a call graph level."""
+    if level < len(_INDENTS):
+        return _INDENTS[level]
+    return "   " * level
 
 
 def _print_backtrace(caller_frame, hide_wrappers=True):
     """Print the call stack backtrace."""
-    stack = []
+    # Markup for each frame, newest first, with whether it is a function call
+    rendered = []
     frame = caller_frame
 
-    # Collect stack frames with their local variables
+    # Render each frame as it is walked; only the indentation, which depends
+    # on the number of older frames, is left for after the walk
     while frame is not None:
-        func_obj = next(
-            (f for f in gc.get_referrers(frame.f_code) if inspect.isfunction(f)),
-            None,
-        )
+        is_wrapper, qualname_parts = _function_info(frame)
 
-        if hide_wrappers and func_obj and hasattr(func_obj, "__wrapped__"):
+        if hide_wrappers and is_wrapper:
             frame = frame.f_back
             continue
 
-        filename = frame.f_code.co_filename
         line_number = frame.f_lineno
         function_name = frame.f_code.co_name
-        short_filename = Path(filename).name
+        short_filename = _short_filename(frame.f_code.co_filename)
+        location = f"[cyan]{short_filename}[/cyan]:[yellow]{line_number}[/yellow]"
 
         # Collect all frames including module level for context
         if function_name == "<module>":
-            # For module level, just store basic info
-            stack.append((short_filename, line_number, None, None, False))
+            # For module level, just show the location
+            rendered.append((False, location))
         else:
             # Get function arguments (parameters)
+            arg_names = _code_arg_names(frame.f_code)
+            frame_locals = frame.f_locals
             is_method = False
-            func_obj = next(
-                (f for f in gc.get_referrers(frame.f_code) if inspect.isfunction(f)),
-                None,
-            )
-            if func_obj and "." in func_obj.__qualname__:
-                arginfo = inspect.getargvalues(frame)
-                if arginfo.args:
-                    first_arg_name = arginfo.args[0]
-                    if first_arg_name in arginfo.locals:
-                        first_arg_value = arginfo.locals[first_arg_name]
+            if qualname_parts:
+                if arg_names:
+                    first_arg_name = arg_names[0]
+                    if first_arg_name in frame_locals:
+                        first_arg_value = frame_locals[first_arg_name]
                         if hasattr(first_arg_value, "__class__"):
                             class_name = first_arg_value.__class__.__name__
-                            if class_name in func_obj.__qualname__.split("."):
+                            if class_name in qualname_parts:
                                 is_method = True
 
-            arginfo = inspect.getargvalues(frame)
-            args_dict = {
-                arg: arginfo.locals[arg] for arg in arginfo.args if arg in arginfo.locals
-            }
-            stack.append((short_filename, line_number, function_name, args_dict, is_method))
+            # Format function with arguments
+            args_str_parts = []
+            for j, arg in enumerate(arg_names):
+                if arg not in frame_locals:
+                    continue
+                if is_method and j == 0:
+                    args_str_parts.append(f"[green]{arg}[/green]")
+                else:
+                    args_str_parts.append(
+                        f"[green]{arg}[/green]={_format_value(frame_locals[arg])}"
+                    )
+            if args_str_parts:
+                args_str = ", ".join(args_str_parts)
+                function = f"[magenta]{function_name}[/magenta]({args_str})"
+            else:
+                function = f"[magenta]{function_name}()[/magenta]"
+            rendered.append((True, f"{location} {function}"))
 
         frame = frame.f_back
 
     # Print stack from oldest to newest (reverse order)
-    if stack:
+    if rendered:
+        # One print per frame, so markup left open by a formatted value
+        # cannot spill into the frames after it. The callers buffer the
+        # console, so this is still written out in one go.
         console.print()
-        module_level_count = 0
         function_depth = 0
 
-        for i, (filename, line_num, func_name, args_dict, is_method) in enumerate(
-            reversed(stack)
-        ):
-            # Adjust index to account for module level entries
-            if func_name is None:
-                # Module level call
-                location = f"[cyan]{filename}[/cyan]:[yellow]{line_num}[/yellow]"
-                console.print(location)
-                module_level_count += 1
+        for is_function, markup in reversed(rendered):
+            if is_function:
+                # Functions are indented one level per enclosing function
+                function_depth += 1
+                console.print(f"{_indent(function_depth)}{markup}")
             else:
-                # Function call
-                depth = i - module_level_count
-                function_depth = depth + 1
-
-                # Build prefix with proper continuation lines
-                prefix = "   " * (depth + 1)
-
-                location = f"[cyan]{filename}[/cyan]:[yellow]{line_num}[/yellow]"
-
-                # Format function with arguments
-                if args_dict:
-                    args_str_parts = []
-                    for j, (k, v) in enumerate(args_dict.items()):
-                        if is_method and j == 0:
-                            args_str_parts.append(f"[green]{k}[/green]")
-                        else:
-                            args_str_parts.append(
-                                f"[green]{k}[/green]={_format_value(v)}"
-                            )
-                    args_str = ", ".join(args_str_parts)
-                    function = f"[magenta]{func_name}[/magenta]({args_str})"
-                else:
-                    function = f"[magenta]{func_name}()[/magenta]"
-
-                console.print(f"{prefix}{location} {function}")
+                # Module level call
+                console.print(markup)
 
         # Return the depth for consistent variable indentation
         return function_depth
@@ -209,20 +345,44 @@ def _print_backtrace(caller_frame, hide_wrappers=True):
         # No function context, just print a simple header
         filename = caller_frame.f_code.co_filename
         line_number = caller_frame.f_lineno
-        short_filename = Path(filename).name
+        short_filename = _short_filename(filename)
         location = f"[cyan]{short_filename}[/cyan]:[yellow]{line_number}[/yellow]"
-        console.print()
-        console.print(location)
+        console.print(f"\n{location}")
         return 0  # No depth
 
 
+# Values rich prints as highlighted str(value) rather than pretty-printing
+_TEXT_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
 def _print_variable(name: str, type_name: str, value: Any, depth: int = 0):
     """Print a single variable with color formatting."""
     # Match the call graph indentation: 2 spaces per depth level, then a tab
-    indent = "   " * (depth + 1)
+    indent = _indent(depth + 1)
     prefix = f"{indent}[green]{name}[/green]: [blue]{type_name}[/blue] = "
-    console.print(prefix, end="")
-    console.print(value)
+    if type(value) in _TEXT_TYPES:
+        # Strings and scalars render as plain highlighted text, so the whole
+        # line can go through rich in one call
+        console.print(f"{prefix}{value}")
+    else:
+        console.print(prefix, end="")
+        console.print(value)
+
+
+def _print_locals(frame, depth: int = 0):
+    """Print every local variable of frame not starting with an underscore."""
+    public_locals = [
+        (name, value)
+        for name, value in frame.f_locals.items()
+        if not name.startswith("_")
+    ]
+    for name, value in public_locals:
+        _print_variable(name, type(value).__name__, value, depth)
+
+
+_MAX_STRING = 30
+_SCALAR_TYPES = frozenset((int, float, bool, type(None)))
+_FLAT_CONTAINER_TYPES = frozenset((list, tuple, set, frozenset, dict))
 
 
 def _format_value(value: Any) -> str:
@@ -235,9 +395,22 @@ def _format_value(value: Any) -> str:
     Returns:
             Formatted string representation of the value
     """
-    from rich.pretty import pretty_repr
-
-    return pretty_repr(value, max_length=1000, max_string=30)
+    # For scalars, short strings and small flat containers that fit on one
+    # line, pretty_repr produces plain repr output, so skip its tree walk
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES:
+        return repr(value)
+    if value_type is str:
+        if len(value) <= _MAX_STRING:
+            return repr(value)
+    elif value_type in _FLAT_CONTAINER_TYPES and len(value) <= 8:
+        items = value.items() if value_type is dict else ((item,) for item in value)
+        if all(type(part) in _SCALAR_TYPES for item in items for part in item):
+            value_repr = repr(value)
+            if len(value_repr) <= 80:
+                return value_repr
+
+    return pretty_repr(value, max_length=1000, max_string=_MAX_STRING)
 
 
 def dprint_vars(**variables):
@@ -263,31 +436,25 @@ def dprint_frame(levels_up: int = 1, hide_wrappers=True):
             def my_function():
                     dprint_frame()
     """
-    frame = inspect.currentframe()
-    if frame is None:
-        print("dprint_frame: Unable to get frame information")
+    if not _enabled:
         return
 
     try:
-        target_frame = frame
-        for _ in range(levels_up):
-            target_frame = target_frame.f_back
-            if target_frame is None:
-                print("dprint_frame: Not enough frames in stack")
-                return
+        target_frame = sys._getframe(levels_up)
+    except ValueError:
+        print("dprint_frame: Not enough frames in stack")
+        return
 
+    # Buffer everything so the whole dump is written to stdout at once
+    with console:
         # Print backtrace
         depth = _print_backtrace(target_frame, hide_wrappers=hide_wrappers)
+        _print_locals(target_frame, depth)
 
-        for var_name, var_value in target_frame.f_locals.items():
-            if not var_name.startswith("_"):
-                type_name = type(var_value).__name__
-                _print_variable(var_name, type_name, var_value, depth)
 
-    finally:
-        del frame
-        if "target_frame" in locals():
-            del target_frame
+# Allow dprint.enable() / dprint.disable() where only the function is imported
+dprint.enable = enable
+dprint.disable = disable
 
 
 # Example usage and tests
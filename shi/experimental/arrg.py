@@ -2,16 +2,10 @@
 
 import functools
 import inspect
+import sys
 import types
-try:
-    from ..dprint import dprint
-except ImportError:
-    # Fallback for when arrg.py is run directly as a script
-    try:
-        from . import dprint
-    except ImportError:
-        import dprint
-from dataclasses import dataclass, field
+from contextvars import ContextVar
+from typing import NamedTuple, Optional
 
 
 def is_private(key: str) -> bool:
@@ -21,17 +15,28 @@ def is_private(key: str) -> bool:
     return key.startswith("_")
 
 
+# Code objects of the wrappers created by @arrg
+_arrg_wrapper_codes = set()
+
+
 def is_wrapper_frame(frame: types.FrameType) -> bool:
     """
     Determine if a frame corresponds to a known function wrapper.
-    Currently checks for the presence of '__wrapped__' in the function object.
+    Checks the frame's code against the wrappers created by @arrg, which
+    avoids materializing the frame's locals.
     """
     if not frame:
         return False
-    frame_locals = frame.f_locals
-    if "__wrapped__" in frame_locals:
-        return True
-    return False
+    return frame.f_code in _arrg_wrapper_codes
+
+
+def skip_wrapper_frames(frame: types.FrameType) -> types.FrameType:
+    """
+    Step past any @arrg wrapper frames to the frame that made the call.
+    """
+    while is_wrapper_frame(frame) and frame.f_back is not None:
+        frame = frame.f_back
+    return frame
 
 
 def filter_privates(d: dict) -> dict:
@@ -41,38 +46,196 @@ def filter_privates(d: dict) -> dict:
     return {k: v for k, v in d.items() if not is_private(k)}
 
 
-@dataclass
+_MISSING = object()
+
+
+class SignatureInfo(NamedTuple):
+    """
+    The parts of a function signature that arrg needs to resolve arguments.
+    """
+
+    param_names: tuple
+    positional_names: tuple
+    pos_only_names: tuple
+    kw_only_names: tuple
+    defaults: dict
+    has_var_kwargs: bool
+
+
+def get_signature_info(func) -> SignatureInfo:
+    """
+    Read a plain function's parameters straight from its code object.
+    Everything else goes through inspect.signature: bound methods, whose code
+    still lists `self`, partials, other callables, and wrappers whose
+    signature is defined by `__wrapped__`.
+    """
+    if not isinstance(func, types.FunctionType) or hasattr(func, "__wrapped__"):
+        return _signature_info_from_inspect(func)
+
+    code = func.__code__
+
+    n_pos = code.co_argcount
+    n_kw_only = code.co_kwonlyargcount
+    names = code.co_varnames
+    positional_names = names[:n_pos]
+    kw_only_names = names[n_pos : n_pos + n_kw_only]
+    has_var_args = bool(code.co_flags & inspect.CO_VARARGS)
+    has_var_kwargs = bool(code.co_flags & inspect.CO_VARKEYWORDS)
+    # co_varnames lists *args and **kwargs after the keyword-only names
+    var_start = n_pos + n_kw_only
+    var_args_name = names[var_start : var_start + has_var_args]
+    var_kwargs_name = names[
+        var_start + has_var_args : var_start + has_var_args + has_var_kwargs
+    ]
+
+    pos_defaults = func.__defaults__ or ()
+    defaults = dict(zip(positional_names[n_pos - len(pos_defaults) :], pos_defaults))
+    defaults.update(func.__kwdefaults__ or {})
+
+    return SignatureInfo(
+        # In declaration order, as inspect.signature lists them
+        param_names=positional_names + var_args_name + kw_only_names + var_kwargs_name,
+        positional_names=positional_names,
+        pos_only_names=names[: code.co_posonlyargcount],
+        kw_only_names=kw_only_names,
+        defaults=defaults,
+        has_var_kwargs=has_var_kwargs,
+    )
+
+
+def _signature_info_from_inspect(func) -> SignatureInfo:
+    P = inspect.Parameter
+    params = tuple(inspect.signature(func).parameters.values())
+    return SignatureInfo(
+        param_names=tuple(p.name for p in params),
+        positional_names=tuple(
+            p.name
+            for p in params
+            if p.kind in (P.POSITIONAL_ONLY, P.POSITIONAL_OR_KEYWORD)
+        ),
+        pos_only_names=tuple(p.name for p in params if p.kind == P.POSITIONAL_ONLY),
+        kw_only_names=tuple(p.name for p in params if p.kind == P.KEYWORD_ONLY),
+        defaults={p.name: p.default for p in params if p.default is not P.empty},
+        has_var_kwargs=any(p.kind == P.VAR_KEYWORD for p in params),
+    )
+
+
+def _callable_globals(func) -> dict:
+    """
+    Globals of the function behind func, looking through partials. Bound
+    methods expose their function's __globals__ directly.
+    """
+    while isinstance(func, functools.partial):
+        func = func.func
+    return getattr(func, "__globals__", {})
+
+
+# How many frames above each @arrg call are searched for local variables
+_MAX_SCOPE_FRAMES = 10
+
+
 class ArrgContext:
     """
-    Data class to hold the context for arrg resolution.
+    Holds the context for arrg resolution.
+    Each active @arrg call pushes one context; nested calls reach the outer
+    ones through `parent`. A context is created per call, so it uses slots
+    rather than a per-instance __dict__.
     """
 
-    extra_kwargs: dict = field(default_factory=dict)
+    __slots__ = ("extra_kwargs", "caller_frame", "parent", "_scope_locals")
+
+    def __init__(
+        self,
+        extra_kwargs: Optional[dict] = None,
+        caller_frame: Optional[types.FrameType] = None,
+        parent: Optional["ArrgContext"] = None,
+    ):
+        self.extra_kwargs = extra_kwargs if extra_kwargs is not None else {}
+        self.caller_frame = caller_frame
+        self.parent = parent
+        self._scope_locals = None
+
+    @property
+    def scope_locals(self) -> tuple:
+        """
+        Local variables of the frames this call can see, innermost first.
+        The walk starts at the caller and includes plain helper frames, and
+        stops at the enclosing @arrg call's wrapper, whose caller is covered
+        by the parent context, or after _MAX_SCOPE_FRAMES frames. The frames
+        do not run while this context is active, so they are read only once.
+        """
+        if self._scope_locals is None:
+            scope_locals = []
+            frame = self.caller_frame
+            while (
+                frame is not None
+                and not is_wrapper_frame(frame)
+                and len(scope_locals) < _MAX_SCOPE_FRAMES
+            ):
+                scope_locals.append(frame.f_locals)
+                frame = frame.f_back
+            self._scope_locals = tuple(scope_locals)
+        return self._scope_locals
+
+    @property
+    def caller_globals(self) -> dict:
+        """
+        Global variables of the calling frame.
+        """
+        frame = self.caller_frame
+        return frame.f_globals if frame is not None else {}
+
+    def lookup_local(self, name: str, default=_MISSING):
+        """
+        Look up a name in the scope locals of this context and its parents.
+        """
+        context = self
+        while context is not None:
+            for frame_locals in context.scope_locals:
+                if name in frame_locals:
+                    return frame_locals[name]
+            context = context.parent
+        return default
+
+    def lookup_global(self, name: str, default=_MISSING):
+        """
+        Look up a name in the caller globals of this context and its parents.
+        """
+        context = self
+        while context is not None:
+            caller_globals = context.caller_globals
+            if name in caller_globals:
+                return caller_globals[name]
+            context = context.parent
+        return default
+
+
+# Shared, read-only context returned when no @arrg call is active
+_EMPTY_ARRG_CONTEXT = ArrgContext(extra_kwargs=types.MappingProxyType({}))
+
+# The innermost active ArrgContext, pushed and popped by each @arrg wrapper.
+_arrg_stack: ContextVar[Optional[ArrgContext]] = ContextVar("_arrg_stack", default=None)
 
 
 def get_arrg_context():
     """
-    Retrieve the nearest __arrg_context__ from the call stack.
+    Retrieve the context of the innermost active @arrg call.
     """
-    frame = inspect.currentframe()
-    while frame:
-        if "__arrg_context__" in frame.f_locals:
-            return frame.f_locals["__arrg_context__"]
-        frame = frame.f_back
-    return ArrgContext()
+    context = _arrg_stack.get()
+    if context is None:
+        return _EMPTY_ARRG_CONTEXT
+    return context
 
 
 def get_frame(depth=1):
     """
     Retrieve the immediate caller's frame.
     """
-    frame = inspect.currentframe()
-    for _ in range(depth):
-        if frame:
-            frame = frame.f_back
-        else:
-            return None
-    return frame
+    try:
+        return sys._getframe(depth)
+    except ValueError:
+        # Not enough frames on the stack
+        return None
 
 
 def get_frames(depth=1):
@@ -80,7 +243,7 @@ def get_frames(depth=1):
     Retrieve a list of frames up to the specified depth.
     """
     frames = []
-    frame = get_frame(depth=2)
+    frame = get_frame(depth=2)  # Our caller's frame
     while frame and len(frames) < depth:
         if not is_wrapper_frame(frame):
             frames.append(frame)
@@ -113,7 +276,32 @@ def get_globals(depth=1):
     return all_globals
 
 
-def arrg(func_or_class):
+def memoize_resolved(func):
+    """
+    Cache the results of func keyed on the arguments it is called with.
+    Calls with unhashable arguments are passed through uncached.
+    """
+    cache = {}
+
+    def cached(*args, **kwargs):
+        try:
+            key = (args, frozenset(kwargs.items()))
+            result = cache.get(key, _MISSING)
+        except TypeError:
+            return func(*args, **kwargs)
+        # Called outside the handler so that errors from func are not
+        # chained to a cache miss
+        if result is _MISSING:
+            result = cache[key] = func(*args, **kwargs)
+        return result
+
+    cached.cache_clear = cache.clear
+    # Part of the @arrg call machinery, like the wrappers themselves
+    _arrg_wrapper_codes.add(cached.__code__)
+    return cached
+
+
+def arrg(func_or_class=None, *, memoize=False):
     """
     Decorator that automatically resolves function arguments from caller scope.
     It effectively flattens the variable resolution scope. Private variables
@@ -128,288 +316,224 @@ def arrg(func_or_class):
     6. Function's global scope
     7. Call Stack Global Scope
     8. None (if not found anywhere)
-    __arrg_context__ stores the full calling context available to nested @arrg functions.
+    Each call pushes an ArrgContext that nested @arrg functions can read via
+    get_arrg_context(); scopes further up are reached through its parents.
+    The local scope of a call is every frame between it and the enclosing
+    @arrg call, nearest first, so locals of plain helper functions and of
+    the enclosing @arrg function are visible too.
+
+    Use @arrg(memoize=True) for pure functions: results are cached on the
+    resolved arguments and reused by later calls that resolve the same values.
+    The cache can be emptied with `func.cache_clear()`.
     """
-    if inspect.isclass(func_or_class):
-        for name, method in inspect.getmembers(func_or_class, inspect.isfunction):
-            if not name.startswith("_"):
-                setattr(func_or_class, name, arrg(method))
+    if func_or_class is None:
+        return functools.partial(arrg, memoize=memoize)
+
+    if isinstance(func_or_class, type):
+        # Only wrap public functions defined on the class itself
+        for name, member in list(vars(func_or_class).items()):
+            if is_private(name):
+                continue
+            if isinstance(member, types.FunctionType):
+                setattr(func_or_class, name, arrg(member, memoize=memoize))
+            elif isinstance(member, (staticmethod, classmethod)) and isinstance(
+                member.__func__, types.FunctionType
+            ):
+                # Wrap the underlying function and keep the descriptor kind
+                wrapped = arrg(member.__func__, memoize=memoize)
+                setattr(func_or_class, name, type(member)(wrapped))
         return func_or_class
 
     func = func_or_class
-    sig = inspect.signature(func)
-    arrg_has_kwarg_var = any(
-        p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values()
+    info = get_signature_info(func)
+
+    # Precompute everything the wrapper needs from the signature so that no
+    # introspection happens per call.
+    max_pos_args = len(info.positional_names)
+    n_pos_only = len(info.pos_only_names)
+    resolvable_names = info.positional_names + info.kw_only_names
+    resolvable_name_set = frozenset(resolvable_names)
+    required_name_set = frozenset(
+        name for name in resolvable_names if name not in info.defaults
     )
-    func_globals = filter_privates(func.__globals__)
-
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        inspect.currentframe().f_locals["__wrapped__"] = func
-        caller_locals = get_locals(10)
-        caller_globals = get_globals(10)
-        parent_context = get_arrg_context()
-
-        kwargs = parent_context.extra_kwargs | kwargs
+    # For each number of positional arguments a call can pass, the names that
+    # must still come by keyword and the names that may. A call matching these
+    # exactly needs no resolution at all.
+    exact_call_shapes = tuple(
+        (
+            required_name_set.difference(info.positional_names[:n]),
+            resolvable_name_set.difference(info.positional_names[:n]),
+        )
+        for n in range(max_pos_args + 1)
+    )
+    # One (name, default, is_private) entry per parameter, in signature order.
+    # Private parameters are never resolved from the surrounding scopes.
+    resolve_plan = tuple(
+        (name, info.defaults.get(name, _MISSING), is_private(name))
+        for name in resolvable_names
+    )
+    arrg_has_kwarg_var = info.has_var_kwargs
+    getframe = sys._getframe
+    target = memoize_resolved(func) if memoize else func
+
+    # Referenced live so that globals assigned after decoration are visible
+    func_globals = _callable_globals(func)
+    func_name = getattr(func, "__name__", type(func).__name__)
+
+    def resolve(args, kwargs, caller_frame):
+        """
+        Resolve the arguments for one call and build its ArrgContext.
+        """
+        parent_context = _arrg_stack.get()
+
+        # Only the immediate caller is captured; outer scopes are reached
+        # through the parent context chain instead of walking the stack.
+        context = ArrgContext(
+            caller_frame=skip_wrapper_frames(caller_frame), parent=parent_context
+        )
 
-        resolved_args = {}
-        extra_kwargs = {}
+        # Only merge when a parent actually passed extras down
+        if parent_context is not None and parent_context.extra_kwargs:
+            kwargs = {**parent_context.extra_kwargs, **kwargs}
 
         # Check for too many positional arguments
-        max_pos_args = sum(
-            1
-            for p in sig.parameters.values()
-            if p.kind
-            in (
-                inspect.Parameter.POSITIONAL_ONLY,
-                inspect.Parameter.POSITIONAL_OR_KEYWORD,
-            )
-        )
         if len(args) > max_pos_args:
             raise TypeError(
-                f"{func.__name__}() takes at most {max_pos_args} positional "
+                f"{func_name}() takes at most {max_pos_args} positional "
                 f"argument(s) but {len(args)} were given."
             )
 
-        # Apply explicitly passed positional arguments
-        for param, arg in zip(sig.parameters.values(), args):
-            if param.kind in (
-                inspect.Parameter.POSITIONAL_ONLY,
-                inspect.Parameter.POSITIONAL_OR_KEYWORD,
-            ):
-                resolved_args[param.name] = arg
-
-        # Apply explicitly passed keyword arguments
-        for key, value in kwargs.items():
-            if key in resolved_args:
-                continue  # Already set by positional args
-            if key in sig.parameters:
-                resolved_args[key] = value
-            else:
-                extra_kwargs[key] = value
-
-        # Fill in missing arguments using arrg's resolution priority (Steps 4-7)
-        for param_name, param in sig.parameters.items():
-            if param_name in resolved_args:
-                continue  # Already resolved
-            if param.kind == inspect.Parameter.VAR_POSITIONAL:
-                continue  # Skip *args
-            if param.kind == inspect.Parameter.VAR_KEYWORD:
-                continue  # Skip **kwargs
-
-            # Step 3: Parent Extra Arguments
-            if param_name in parent_context.extra_kwargs:
-                resolved_args[param_name] = parent_context.extra_kwargs[param_name]
-                continue
+        # Keywords not naming a parameter are passed on to nested @arrg calls
+        extra_kwargs = context.extra_kwargs
+        if kwargs:
+            for key, value in kwargs.items():
+                if key not in resolvable_name_set:
+                    extra_kwargs[key] = value
+
+        # Resolve every parameter in a single pass, in priority order
+        n_args = len(args)
+        lookup_local = context.lookup_local
+        lookup_global = context.lookup_global
+        positional_values = []
+        resolved_args = {}
+        for i, (param_name, default, private) in enumerate(resolve_plan):
+            # Step 1: Explicitly passed positional arguments
+            if i < n_args:
+                value = args[i]
+            # Steps 2-3: Explicit keyword arguments, which already include
+            # the parent's extra arguments
+            elif param_name in kwargs:
+                value = kwargs[param_name]
             # Step 4: Function's default parameter value
-            if param.default != inspect.Parameter.empty:
-                resolved_args[param_name] = param.default
-            # Step 5: Call Stack Local Scope
-            elif param_name in caller_locals:
-                resolved_args[param_name] = caller_locals[param_name]
-            # Step 6: Function's global scope
-            elif param_name in func_globals:
-                resolved_args[param_name] = func_globals[param_name]
-            # Step 7: Call Stack Global Scope
-            elif param_name in caller_globals:
-                resolved_args[param_name] = caller_globals[param_name]
-            # Step 8: If not found anywhere, default to None
+            elif default is not _MISSING:
+                value = default
+            elif private:
+                value = None
             else:
-                resolved_args[param_name] = None
-
-        # Separate resolved_args into positional and keyword arguments for sig.bind
-        pos_only_values = []
-        for param in sig.parameters.values():
-            if param.kind == inspect.Parameter.POSITIONAL_ONLY:
-                pos_only_values.append(resolved_args[param.name])
-                del resolved_args[param.name]
+                # Step 5: Call Stack Local Scope
+                value = lookup_local(param_name)
+                # Step 6: Function's global scope
+                if value is _MISSING:
+                    value = func_globals.get(param_name, _MISSING)
+                # Step 7: Call Stack Global Scope
+                if value is _MISSING:
+                    value = lookup_global(param_name)
+                # Step 8: If not found anywhere, default to None
+                if value is _MISSING:
+                    value = None
+
+            # Positional parameters are passed positionally, which also covers
+            # positional-only ones that cannot be passed by keyword
+            if i < max_pos_args:
+                positional_values.append(value)
+            else:
+                resolved_args[param_name] = value
+
+        return context, positional_values, resolved_args
+
+    # Pick the wrapper for this signature's shape once, so the common case of
+    # plain named parameters carries no positional-only or **kwargs handling.
+    if inspect.iscoroutinefunction(func):
+        if memoize:
+            raise TypeError("memoize is not supported for coroutine functions")
+
+        async def run(context, positional_values, resolved_args):
+            # The context has to stay set while the coroutine runs, not just
+            # while it is created, so nested @arrg calls made after an await
+            # still see it. Each task runs in its own copy of the context.
+            token = _arrg_stack.set(context)
+            try:
+                return await func(*positional_values, **resolved_args)
+            finally:
+                _arrg_stack.reset(token)
+
+        # Arguments are resolved when the coroutine is created, while the
+        # caller's frame and context are current. The coroutine body only
+        # runs once it is awaited or scheduled, from an event loop frame.
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            context, positional_values, resolved_args = resolve(
+                args, kwargs, getframe(1)
+            )
+            if arrg_has_kwarg_var and context.extra_kwargs:
+                resolved_args.update(context.extra_kwargs)
+            return run(context, positional_values, resolved_args)
 
-        __arrg_context__ = ArrgContext(extra_kwargs=extra_kwargs)
+        if hasattr(inspect, "markcoroutinefunction"):
+            inspect.markcoroutinefunction(wrapper)
+        # The coroutine's frame bounds the local scope of nested calls
+        _arrg_wrapper_codes.add(run.__code__)
 
-        # Call the function using the BoundArguments object
-        if arrg_has_kwarg_var:
-            resolved_args.update(extra_kwargs)
-        return func(*pos_only_values, **resolved_args)
+    elif n_pos_only or arrg_has_kwarg_var:
 
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            context, positional_values, resolved_args = resolve(
+                args, kwargs, getframe(1)
+            )
+            if arrg_has_kwarg_var and context.extra_kwargs:
+                resolved_args.update(context.extra_kwargs)
+
+            # Make this call's context visible to nested @arrg calls
+            token = _arrg_stack.set(context)
+            try:
+                return target(*positional_values, **resolved_args)
+            finally:
+                _arrg_stack.reset(token)
+
+    else:
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            parent_context = _arrg_stack.get()
+            if (
+                len(args) <= max_pos_args
+                and (parent_context is None or not parent_context.extra_kwargs)
+                and exact_call_shapes[len(args)][0]
+                <= kwargs.keys()
+                <= exact_call_shapes[len(args)][1]
+            ):
+                # Every required argument was passed explicitly and there are
+                # no extras to hand down, so nothing needs resolving.
+                context = ArrgContext(
+                    caller_frame=skip_wrapper_frames(getframe(1)),
+                    parent=parent_context,
+                )
+                positional_values = args
+                resolved_args = kwargs
+            else:
+                context, positional_values, resolved_args = resolve(
+                    args, kwargs, getframe(1)
+                )
+
+            # Make this call's context visible to nested @arrg calls
+            token = _arrg_stack.set(context)
+            try:
+                return target(*positional_values, **resolved_args)
+            finally:
+                _arrg_stack.reset(token)
+
+    _arrg_wrapper_codes.add(wrapper.__code__)
+    if memoize:
+        wrapper.cache_clear = target.cache_clear
     return wrapper
-
-
-import unittest
-
-
-class ArrgTest(unittest.TestCase):
-
-    def test_arrg(self):
-        a = 1
-        b = 2
-
-        @arrg
-        def foo(a, b):
-            return a, b
-
-        # If a or b is not explicitly given, get the value from function global
-        self.assertEqual(foo(), (1, 2))
-        self.assertEqual(foo(a=10), (10, 2))
-        self.assertEqual(foo(b=20), (1, 20))
-        self.assertEqual(foo(10), (10, 2))
-
-    def test_extra_kwargs(self):
-        a = 1
-        b = 2
-
-        @arrg
-        def foo(a, b):
-            return a, b
-
-        # Extra keywords args are accepted
-        self.assertEqual(foo(x=1, y=2), (1, 2))
-
-    def test_extra_kwargs_fall_through(self):
-        a1 = 1
-        b1 = 2
-
-        @arrg
-        def foo3(a3, b3, c3=300, **kwargs):
-            return a3, b3, c3, *kwargs.values()
-
-        @arrg
-        def foo2(a2, b2, c2=30):
-            return a2, b2, c2, *foo3()
-
-        @arrg
-        def foo1(a1, b1, c1=3):
-            return a1, b1, c1, *foo2()
-
-        self.assertEqual(foo1(), (1, 2, 3, None, None, 30, None, None, 300))
-        self.assertEqual(foo1(a3=10, b3=20), (1, 2, 3, None, None, 30, 10, 20, 300))
-        self.assertEqual(
-            foo1(x=-1, y=-2), (1, 2, 3, None, None, 30, None, None, 300, -1, -2)
-        )
-        self.assertEqual(
-            foo1(c1=-3, c2=-30, c3=-300), (1, 2, -3, None, None, -30, None, None, -300)
-        )
-        self.assertEqual(
-            foo1(a1=1, b1=2, c1=3, a3=100, b3=200, c3=300, a2=10, b2=20, c2=30),
-            (1, 2, 3, 10, 20, 30, 100, 200, 300),
-        )
-
-    def test_function_globals(self):
-        a = 1
-        b = 2
-
-        @arrg
-        def foo(a, b):
-            return a, b
-
-        self.assertEqual(foo(), (1, 2))
-        a = 100
-        self.assertEqual(foo(), (100, 2))
-
-    def test_default_to_none(self):
-        c = 3
-
-        @arrg
-        def foo(a, b, c):
-            return a, b, c
-
-        # Args without a global default will be None
-        self.assertEqual(foo(), (None, None, 3))
-
-        @arrg
-        def foo(a, b=20):
-            return a, b
-
-        self.assertEqual(foo(), (None, 20))
-
-        @arrg
-        def foo(a, b):
-            a = -1
-            b = -2
-            return a, b
-
-        # Local scope always takes precedence
-        self.assertEqual(foo(a=10), (-1, -2))
-
-    def test_missing_args(self):
-        a = -1
-        b = -2
-
-        @arrg
-        def foo1(y):
-            a = 10
-            b = 20
-            x = 100
-            return foo2()
-
-        @arrg
-        def foo2(a, x, y):
-            return a, b, x, y
-
-        # arrgs not in function global scope or explicitly passed in
-        # are pulled from caller's local scope
-        self.assertEqual(foo1(), (10, -2, 100, None))
-        self.assertEqual(foo1(y=200), (10, -2, 100, 200))
-
-    def test_var_kwargs(self):
-        @arrg
-        def foo(a, b=1, **kwargs):
-            return a, b, kwargs
-
-        self.assertEqual(foo(10), (10, 1, {}))
-        self.assertEqual(foo(10, x=1, y=2, b=20), (10, 20, {"x": 1, "y": 2}))
-
-    def test_positional_only(self):
-        a = 1
-        b = 2
-
-        @arrg
-        def foo(a, /, b, *, c=3, **kwargs):
-            return a, b, c, kwargs
-
-        self.assertEqual(foo(), (1, 2, 3, {}))
-
-    def test_dynamic_wrapper(self):
-        def unwrapped_foo(a, b):
-            return a, b
-
-        wrapped_foo = arrg(unwrapped_foo)()
-
-    def test_class_decorator(self):
-        a = 1
-        b = 2
-
-        @arrg
-        class MyClass:
-            def method1(self, a, b):
-                return a, b
-
-            def method2(self, a, b):
-                return a * 2, b * 2
-
-            def _private_method(self, a, b):
-                return a, b
-
-        instance = MyClass()
-        self.assertEqual(instance.method1(), (1, 2))
-        self.assertEqual(instance.method1(a=10), (10, 2))
-        self.assertEqual(instance.method2(), (2, 4))
-
-        # Check that private methods are not wrapped
-        with self.assertRaises(TypeError):
-            instance._private_method()
-
-    def test_too_many_positional_args(self):
-        @arrg
-        def foo(a, b):
-            return a, b
-
-        with self.assertRaises(TypeError) as context:
-            foo(1, 2, 3)
-        self.assertIn(
-            "takes at most 2 positional argument(s) but 3 were given",
-            str(context.exception),
-        )
-
-
-if __name__ == "__main__":
-    unittest.main()
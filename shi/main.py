@@ -194,6 +194,7 @@ def _run_main_at_exit():
                 extract_global_args_from_list,
                 process_globals,
                 inject_globals,
+                get_command_signature,
             )
 
             raw_globals, clean_args_to_parse = extract_global_args_from_list(
@@ -203,7 +204,7 @@ def _run_main_at_exit():
 
             # Normalize and inject global arguments
             normalized_globals = process_globals(raw_globals)
-            sig = inspect.signature(orig)
+            sig = get_command_signature(orig).sig
             inject_globals(sig, bound.arguments, normalized_globals)
 
             rtn = wrapped(*bound.args, **bound.kwargs)
@@ -0,0 +1,459 @@
+import functools
+import inspect
+import unittest
+
+from shi.experimental.arrg import (
+    arrg,
+    get_arrg_context,
+    get_signature_info,
+)
+
+
+class ArrgTest(unittest.TestCase):
+
+    def test_arrg(self):
+        a = 1
+        b = 2
+
+        @arrg
+        def foo(a, b):
+            return a, b
+
+        # If a or b is not explicitly given, get the value from function global
+        self.assertEqual(foo(), (1, 2))
+        self.assertEqual(foo(a=10), (10, 2))
+        self.assertEqual(foo(b=20), (1, 20))
+        self.assertEqual(foo(10), (10, 2))
+
+    def test_all_args_passed_by_keyword(self):
+        a = 1
+
+        @arrg
+        def inner(a):
+            return a
+
+        @arrg
+        def outer(b, c=3):
+            return b, c, inner()
+
+        # Nested calls still see the caller's scope when every argument of
+        # the outer function was given explicitly
+        self.assertEqual(outer(b=2), (2, 3, 1))
+        self.assertEqual(outer(b=2, c=30), (2, 30, 1))
+
+    def test_all_args_passed_explicitly(self):
+        a = 1
+        b = 2
+
+        @arrg
+        def foo(a, b, c=3):
+            return a, b, c
+
+        self.assertEqual(foo(10, b=20), (10, 20, 3))
+        self.assertEqual(foo(10, 20, 30), (10, 20, 30))
+        # A parameter missing from an otherwise explicit call is still resolved
+        self.assertEqual(foo(10, c=30), (10, 2, 30))
+
+    def test_extra_kwargs(self):
+        a = 1
+        b = 2
+
+        @arrg
+        def foo(a, b):
+            return a, b
+
+        # Extra keywords args are accepted
+        self.assertEqual(foo(x=1, y=2), (1, 2))
+
+    def test_extra_kwargs_fall_through(self):
+        a1 = 1
+        b1 = 2
+
+        @arrg
+        def foo3(a3, b3, c3=300, **kwargs):
+            return a3, b3, c3, *kwargs.values()
+
+        @arrg
+        def foo2(a2, b2, c2=30):
+            return a2, b2, c2, *foo3()
+
+        @arrg
+        def foo1(a1, b1, c1=3):
+            return a1, b1, c1, *foo2()
+
+        self.assertEqual(foo1(), (1, 2, 3, None, None, 30, None, None, 300))
+        self.assertEqual(foo1(a3=10, b3=20), (1, 2, 3, None, None, 30, 10, 20, 300))
+        self.assertEqual(
+            foo1(x=-1, y=-2), (1, 2, 3, None, None, 30, None, None, 300, -1, -2)
+        )
+        self.assertEqual(
+            foo1(c1=-3, c2=-30, c3=-300), (1, 2, -3, None, None, -30, None, None, -300)
+        )
+        self.assertEqual(
+            foo1(a1=1, b1=2, c1=3, a3=100, b3=200, c3=300, a2=10, b2=20, c2=30),
+            (1, 2, 3, 10, 20, 30, 100, 200, 300),
+        )
+
+    def test_function_globals(self):
+        a = 1
+        b = 2
+
+        @arrg
+        def foo(a, b):
+            return a, b
+
+        self.assertEqual(foo(), (1, 2))
+        a = 100
+        self.assertEqual(foo(), (100, 2))
+
+    def test_live_function_globals(self):
+        namespace = {}
+        exec("def foo(x):\n    return x", namespace)
+        foo = arrg(namespace["foo"])
+
+        # Globals assigned after decoration are still resolved
+        namespace["x"] = 5
+        self.assertEqual(foo(), 5)
+
+    def test_default_to_none(self):
+        c = 3
+
+        @arrg
+        def foo(a, b, c):
+            return a, b, c
+
+        # Args without a global default will be None
+        self.assertEqual(foo(), (None, None, 3))
+
+        @arrg
+        def foo(a, b=20):
+            return a, b
+
+        self.assertEqual(foo(), (None, 20))
+
+        @arrg
+        def foo(a, b):
+            a = -1
+            b = -2
+            return a, b
+
+        # Local scope always takes precedence
+        self.assertEqual(foo(a=10), (-1, -2))
+
+    def test_missing_args(self):
+        a = -1
+        b = -2
+
+        @arrg
+        def foo1(y):
+            a = 10
+            b = 20
+            x = 100
+            return foo2()
+
+        @arrg
+        def foo2(a, x, y):
+            return a, b, x, y
+
+        # arrgs not in function global scope or explicitly passed in
+        # are pulled from caller's local scope
+        self.assertEqual(foo1(), (10, -2, 100, None))
+        self.assertEqual(foo1(y=200), (10, -2, 100, 200))
+
+    def test_helper_frame_locals(self):
+        @arrg
+        def foo(a):
+            return a
+
+        def helper():
+            return foo()
+
+        a = 5
+        # Locals of the scope that called a plain helper are still visible
+        self.assertEqual(helper(), 5)
+
+    def test_locals_through_plain_helper(self):
+        @arrg
+        def inner(x):
+            return x
+
+        def helper():
+            return inner()
+
+        @arrg
+        def outer():
+            x = 42
+            return helper()
+
+        # The enclosing @arrg function's locals are reached through the helper
+        self.assertEqual(outer(), 42)
+
+    def test_locals_through_plain_decorator(self):
+        def passthrough(f):
+            @functools.wraps(f)
+            def inner(*args, **kwargs):
+                return f(*args, **kwargs)
+
+            return inner
+
+        @passthrough
+        @arrg
+        def foo(a):
+            return a
+
+        a = 3
+        self.assertEqual(foo(), 3)
+
+    def test_var_kwargs(self):
+        @arrg
+        def foo(a, b=1, **kwargs):
+            return a, b, kwargs
+
+        self.assertEqual(foo(10), (10, 1, {}))
+        self.assertEqual(foo(10, x=1, y=2, b=20), (10, 20, {"x": 1, "y": 2}))
+
+    def test_positional_only(self):
+        a = 1
+        b = 2
+
+        @arrg
+        def foo(a, /, b, *, c=3, **kwargs):
+            return a, b, c, kwargs
+
+        self.assertEqual(foo(), (1, 2, 3, {}))
+
+    def test_dynamic_wrapper(self):
+        def unwrapped_foo(a, b):
+            return a, b
+
+        wrapped_foo = arrg(unwrapped_foo)()
+
+    def test_class_decorator(self):
+        a = 1
+        b = 2
+
+        @arrg
+        class MyClass:
+            def method1(self, a, b):
+                return a, b
+
+            def method2(self, a, b):
+                return a * 2, b * 2
+
+            def _private_method(self, a, b):
+                return a, b
+
+        instance = MyClass()
+        self.assertEqual(instance.method1(), (1, 2))
+        self.assertEqual(instance.method1(a=10), (10, 2))
+        self.assertEqual(instance.method2(), (2, 4))
+
+        # Check that private methods are not wrapped
+        with self.assertRaises(TypeError):
+            instance._private_method()
+
+    def test_class_decorator_staticmethod(self):
+        a = 7
+
+        @arrg
+        class MyClass:
+            @staticmethod
+            def method(a):
+                return a
+
+        self.assertEqual(MyClass.method(), 7)
+        self.assertEqual(MyClass().method(), 7)
+        self.assertEqual(MyClass.method(a=1), 1)
+
+    def test_class_decorator_classmethod(self):
+        a = 7
+
+        @arrg
+        class MyClass:
+            @classmethod
+            def method(cls, a):
+                return cls, a
+
+        self.assertEqual(MyClass.method(), (MyClass, 7))
+        self.assertEqual(MyClass().method(a=1), (MyClass, 1))
+
+    def test_class_decorator_skips_inherited(self):
+        a = 1
+
+        class Base:
+            def method(self, a):
+                return a
+
+        @arrg
+        class Child(Base):
+            def own(self, a):
+                return a
+
+        self.assertEqual(Child().own(), 1)
+        self.assertIs(Child.method, Base.method)
+
+    def test_get_arrg_context(self):
+        @arrg
+        def foo(a):
+            return get_arrg_context().extra_kwargs
+
+        # Outside of any @arrg call the shared empty context is returned
+        self.assertEqual(dict(get_arrg_context().extra_kwargs), {})
+        self.assertEqual(foo(a=1, x=2), {"x": 2})
+
+    def test_wrapper_locals_not_visible(self):
+        @arrg
+        def inner(resolved_args, parent_context):
+            return resolved_args, parent_context
+
+        @arrg
+        def outer():
+            return inner()
+
+        # Internals of the outer wrapper must not leak into resolution
+        self.assertEqual(outer(), (None, None))
+
+    def test_private_params_not_resolved(self):
+        _a = 1
+
+        @arrg
+        def foo(_a, b=2):
+            return _a, b
+
+        self.assertEqual(foo(), (None, 2))
+        self.assertEqual(foo(_a=10), (10, 2))
+
+    def test_signature_info(self):
+        def foo(a, b=2, /, c=3, *args, d, e=5, **kwargs):
+            pass
+
+        info = get_signature_info(foo)
+        self.assertEqual(info.param_names, ("a", "b", "c", "args", "d", "e", "kwargs"))
+        self.assertEqual(info.param_names, tuple(inspect.signature(foo).parameters))
+        self.assertEqual(info.positional_names, ("a", "b", "c"))
+        self.assertEqual(info.pos_only_names, ("a", "b"))
+        self.assertEqual(info.kw_only_names, ("d", "e"))
+        self.assertEqual(info.defaults, {"b": 2, "c": 3, "e": 5})
+        self.assertTrue(info.has_var_kwargs)
+
+    def test_decorated_function(self):
+        a = 1
+
+        def passthrough(f):
+            @functools.wraps(f)
+            def inner(*args, **kwargs):
+                return f(*args, **kwargs)
+
+            return inner
+
+        @arrg
+        @passthrough
+        def foo(a, b=2):
+            return a, b
+
+        # The signature comes from the wrapped function, not the decorator
+        self.assertEqual(foo(), (1, 2))
+
+    def test_bound_method_and_partial(self):
+        class MyClass:
+            def method(self, a, b):
+                return a, b
+
+        def add(a, b, c):
+            return a, b, c
+
+        # self is already bound, so it is not part of the resolved signature
+        self.assertEqual(arrg(MyClass().method)(1, 2), (1, 2))
+        a = 10
+        b = 20
+        self.assertEqual(arrg(MyClass().method)(b=2), (10, 2))
+
+        # Arguments bound by the partial are not resolved again
+        self.assertEqual(arrg(functools.partial(add, 1))(c=3), (1, 20, 3))
+
+    def test_memoize(self):
+        calls = []
+
+        @arrg(memoize=True)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        x = 3
+        self.assertEqual(square(), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(x=4), 16)
+        self.assertEqual(calls, [3, 4])
+
+        square.cache_clear()
+        self.assertEqual(square(), 9)
+        self.assertEqual(calls, [3, 4, 3])
+
+    def test_memoize_error_not_chained(self):
+        @arrg(memoize=True)
+        def fail(x):
+            raise ValueError(x)
+
+        with self.assertRaises(ValueError) as context:
+            fail(1)
+        self.assertIsNone(context.exception.__context__)
+
+    def test_memoize_unhashable(self):
+        @arrg(memoize=True)
+        def first(items):
+            return items[0]
+
+        self.assertEqual(first([1, 2]), 1)
+        self.assertEqual(first(items=[3]), 3)
+
+    def test_async(self):
+        import asyncio
+
+        @arrg
+        async def inner(name, tag):
+            return name, tag
+
+        @arrg
+        async def outer(name, delay):
+            await asyncio.sleep(delay)
+            return await inner()
+
+        async def main():
+            # Interleaved tasks each see their own extras after an await
+            return await asyncio.gather(
+                outer(name="slow", delay=0.02, tag=1),
+                outer(name="fast", delay=0, tag=2),
+            )
+
+        self.assertEqual(asyncio.run(main()), [("slow", 1), ("fast", 2)])
+
+    def test_async_resolves_at_call_time(self):
+        import asyncio
+
+        @arrg
+        async def job(user):
+            return user
+
+        async def main():
+            user = "alice"
+            # Scheduled coroutines start from the event loop, but the missing
+            # argument still comes from the scope that called job()
+            return await job(), await asyncio.gather(job(), job(user="bob"))
+
+        self.assertEqual(asyncio.run(main()), ("alice", ["alice", "bob"]))
+
+    def test_too_many_positional_args(self):
+        @arrg
+        def foo(a, b):
+            return a, b
+
+        with self.assertRaises(TypeError) as context:
+            foo(1, 2, 3)
+        self.assertIn(
+            "takes at most 2 positional argument(s) but 3 were given",
+            str(context.exception),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,23 @@
 import unittest
+import inspect
 import io
 import sys
 from unittest.mock import patch
 
 from typing import Literal, Any
 from enum import Enum, auto
-from shi.cli import cli, run_cli, parse_cli_args, convert_value, cli_commands, console
+from shi.cli import (
+    cli,
+    run_cli,
+    parse_cli_args,
+    convert_value,
+    cli_commands,
+    console,
+    get_command_signature,
+    split_long_option,
+    split_key_value,
+    split_postfix_op,
+)
 
 
 class Color(Enum):
@@ -45,6 +57,27 @@ class TestCli(unittest.TestCase):
             convert_value("not_a_number", int), "not_a_number"
         )  # Fallback to str
 
+    def test_convert_value_int_prefixes(self):
+        for target_type in (int, inspect.Parameter.empty):
+            self.assertEqual(convert_value("0x1F", target_type), 31)
+            self.assertEqual(convert_value("0b101", target_type), 5)
+            self.assertEqual(convert_value("0o17", target_type), 15)
+            self.assertEqual(convert_value("007", target_type), 7)
+
+    def test_convert_value_json(self):
+        self.assertEqual(convert_value('[{"a": 1}]', list), [{"a": 1}])
+        self.assertEqual(convert_value('{"a": [1, 2]}', dict), {"a": [1, 2]})
+        self.assertEqual(convert_value("not json", list), "not json")
+        self.assertEqual(convert_value('{"a": 1}', list), '{"a": 1}')
+
+    def test_convert_value_unannotated_literals(self):
+        empty = inspect.Parameter.empty
+        self.assertEqual(convert_value("[1, 'a']", empty), [1, "a"])
+        self.assertEqual(convert_value("{'a': None}", empty), {"a": None})
+        self.assertIsNone(convert_value("None", empty))
+        # Only literals are evaluated, never arbitrary expressions
+        self.assertEqual(convert_value("[len('ab')]", empty), "[len('ab')]")
+
     def test_convert_value_enum(self):
         self.assertEqual(convert_value("RED", Color), Color.RED)
         self.assertEqual(convert_value("green", Color), Color.GREEN)  # Case insensitive
@@ -68,6 +101,38 @@ class TestCli(unittest.TestCase):
         parsed = parse_cli_args(self.get_original_func("test_func"), cli_args_raw)
         self.assertEqual(parsed.arguments, {"arg1": "value1", "arg2": 123})
 
+    def test_command_signature_cached(self):
+        @cli
+        def test_func(a: int, b, c=1, *args, d=2):
+            pass
+
+        func = self.get_original_func("test_func")
+        command_sig = get_command_signature(func)
+        self.assertIs(get_command_signature(func), command_sig)
+        empty = inspect.Parameter.empty
+        self.assertEqual(command_sig.positional_types, (int, empty, empty))
+
+    def test_command_signature_unhashable(self):
+        class Command:
+            __hash__ = None
+
+            def __call__(self, a: int):
+                pass
+
+        self.assertEqual(get_command_signature(Command()).param_names, {"a"})
+
+    def test_split_cli_tokens(self):
+        self.assertEqual(split_long_option("--name=Bob"), ("name", "Bob"))
+        self.assertEqual(split_long_option("--flag"), ("flag", None))
+        self.assertIsNone(split_long_option("--flag="))
+        self.assertEqual(split_key_value("a=b=c"), ("a", "b=c"))
+        self.assertIsNone(split_key_value("a b=c"))
+        self.assertEqual(split_postfix_op("my-flag+"), ("my-flag", "+"))
+        self.assertEqual(split_postfix_op("flag--"), ("flag-", "-"))
+        self.assertEqual(split_postfix_op("flag!~~"), ("flag", "!~~"))
+        self.assertIsNone(split_postfix_op("flag~~~~"))
+        self.assertIsNone(split_postfix_op("-flag+"))
+
     def test_parse_cli_args_quoted_string(self):
         @cli
         def test_func(message: str):
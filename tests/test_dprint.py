@@ -1,35 +1,45 @@
+import functools
 import unittest
 import io
-import sys
+import os
 import re
-from pathlib import Path
+import sys
+from contextlib import redirect_stdout
 from unittest.mock import patch
 
+from rich.console import Console
+
 # Assuming shi is installed in editable mode or sys.path is configured
-from shi.dprint import dprint, _format_value, _print_variable, _print_backtrace
+from shi.dprint import (
+    dprint,
+    _disabled_by_env,
+    _format_value,
+    _print_variable,
+    _print_backtrace,
+)
 
+# Remove ANSI escape codes from a string
+_strip_ansi = functools.partial(re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]").sub, "")
 
-class TestDprint(unittest.TestCase):
 
-    def setUp(self):
-        # Capture stdout for testing print statements
-        self.held_stdout = sys.stdout
-        self.mock_stdout = io.StringIO()
-        sys.stdout = self.mock_stdout
+def _format_plain(value):
+    """_format_value output with the color codes stripped."""
+    return _strip_ansi(_format_value(value))
 
-    def tearDown(self):
-        # Restore stdout
-        sys.stdout = self.held_stdout
+
+class TestDprint(unittest.TestCase):
 
     def _remove_ansi_escape_codes(self, text):
-        # Regex to remove ANSI escape codes
-        ansi_escape = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]")
-        return ansi_escape.sub("", text)
+        if "\x1b" not in text:
+            return text
+        return _strip_ansi(text)
 
     def test_dprint_basic_variable(self):
         my_var = 123
-        dprint(my_var)
-        output = self._remove_ansi_escape_codes(self.mock_stdout.getvalue())
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            dprint(my_var)
+        output = self._remove_ansi_escape_codes(buf.getvalue())
 
         # Expected output format (adjust based on actual dprint output)
         # We'll check for key components rather than exact string match due to potential color codes/line numbers
@@ -40,19 +50,62 @@ class TestDprint(unittest.TestCase):
     def test_dprint_multiple_variables(self):
         a = "hello"
         b = [1, 2]
-        dprint(a, b)
-        output = self._remove_ansi_escape_codes(self.mock_stdout.getvalue())
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            dprint(a, b)
+        output = self._remove_ansi_escape_codes(buf.getvalue())
 
         self.assertIn("test_dprint.py", output)
         self.assertIn("test_dprint_multiple_variables(", output)
         self.assertIn("a: str = hello", output)
         self.assertIn("b: list = [1, 2]", output)
 
+    def test_dprint_call_arguments(self):
+        a = 1
+        b = 2
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            dprint(max(a, b), "x, y")
+        output = self._remove_ansi_escape_codes(buf.getvalue())
+
+        self.assertIn("max(a, b): int = 2", output)
+        self.assertIn('"x, y": str = x, y', output)
+
+    def test_dprint_multiline_call(self):
+        a = 1
+        b = [1, 2]
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            dprint(
+                a,
+                b[0],
+            )
+        output = self._remove_ansi_escape_codes(buf.getvalue())
+
+        self.assertIn("a: int = 1", output)
+        self.assertIn("b[0]: int = 1", output)
+
+    def test_dprint_calls_on_several_lines(self):
+        a = 1
+        b = 2
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            pair = (dprint(a),
+                dprint(b))
+        output = self._remove_ansi_escape_codes(buf.getvalue())
+
+        # Each call is named from its own arguments, not the other call's
+        self.assertIn("a: int = 1", output)
+        self.assertIn("b: int = 2", output)
+        self.assertNotIn("b: int = 1", output)
+
     def test_dprint_keyword_arguments(self):
         val1 = 10
         val2 = "test"
-        dprint(x=val1, y=val2)
-        output = self._remove_ansi_escape_codes(self.mock_stdout.getvalue())
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            dprint(x=val1, y=val2)
+        output = self._remove_ansi_escape_codes(buf.getvalue())
 
         self.assertIn("test_dprint.py", output)
         self.assertIn("test_dprint_keyword_arguments(", output)
@@ -68,8 +121,10 @@ class TestDprint(unittest.TestCase):
             outer_var = 5
             inner_func(outer_var)
 
-        outer_func()
-        output = self._remove_ansi_escape_codes(self.mock_stdout.getvalue())
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            outer_func()
+        output = self._remove_ansi_escape_codes(buf.getvalue())
 
         self.assertIn("test_dprint.py", output)
         self.assertIn("outer_func(", output)
@@ -77,35 +132,61 @@ class TestDprint(unittest.TestCase):
         self.assertIn("param=5", output)
         self.assertIn("local_var: int = 10", output)
 
-    def test_format_value_string(self):
-        self.assertIn("'short'", self._remove_ansi_escape_codes(_format_value("short")))
-        self.assertIn(
-            "'aaaaaaaaaaaaaaaaaaaaaaaaaaaaaa'+120",
-            self._remove_ansi_escape_codes(_format_value("a" * 150)),
-        )
+    def test_dprint_deep_stack(self):
+        def recurse(i):
+            dprint(i)
+            if i < 19:
+                recurse(i + 1)
 
-    def test_format_value_list(self):
-        self.assertIn(
-            "[1, 2, 3]", self._remove_ansi_escape_codes(_format_value([1, 2, 3]))
-        )
-        self.assertIn(
-            "[",
-            self._remove_ansi_escape_codes(_format_value(list(range(100)))),
-        )
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            recurse(0)
+        output = self._remove_ansi_escape_codes(buf.getvalue())
 
-    def test_format_value_dict(self):
-        self.assertIn(
-            "{'a': 1}", self._remove_ansi_escape_codes(_format_value({"a": 1}))
-        )
-        self.assertIn(
-            "{'a': 1, 'b': 2}",
-            self._remove_ansi_escape_codes(_format_value({"a": 1, "b": 2})),
-        )
+        # Each of the 20 calls prints a backtrace through every level above it
+        self.assertEqual(output.count("recurse(i="), 20 * 21 // 2)
+        self.assertIn("recurse(i=19)", output)
 
-    def test_format_value_none_bool(self):
-        self.assertIn("None", self._remove_ansi_escape_codes(_format_value(None)))
-        self.assertIn("True", self._remove_ansi_escape_codes(_format_value(True)))
-        self.assertIn("False", self._remove_ansi_escape_codes(_format_value(False)))
+    def test_dprint_disable(self):
+        my_var = 123
+        buf = io.StringIO()
+        dprint.disable()
+        try:
+            with redirect_stdout(buf):
+                dprint(my_var)
+        finally:
+            dprint.enable()
+        self.assertEqual(buf.getvalue(), "")
+
+        with redirect_stdout(buf):
+            dprint(my_var)
+        self.assertIn("my_var", buf.getvalue())
+
+    def test_dprint_markup_stays_in_frame(self):
+        def inner(y):
+            dprint(y)
+
+        def outer(x):
+            inner(1)
+
+        def inner_line(x):
+            buf = io.StringIO()
+            console = Console(file=buf, force_terminal=True, width=1000)
+            with patch.object(sys.modules["shi.dprint"], "console", console):
+                outer(x)
+            lines = buf.getvalue().splitlines()
+            return next(line for line in lines if "inner(y=" in _strip_ansi(line))
+
+        # An unclosed tag in outer's argument must not style inner's line
+        self.assertEqual(inner_line("[bold]"), inner_line("plain"))
+
+    def test_dprint_disable_env(self):
+        for value in ("1", "true", "yes"):
+            with patch.dict(os.environ, {"DPRINT_DISABLE": value}):
+                self.assertTrue(_disabled_by_env())
+        for value in ("", "0", "false", "no"):
+            with patch.dict(os.environ, {"DPRINT_DISABLE": value}):
+                self.assertFalse(_disabled_by_env())
 
     def test_dprint_bound_method_self(self):
         class MyClass:
@@ -113,16 +194,16 @@ class TestDprint(unittest.TestCase):
                 dprint(x)
 
         instance = MyClass()
-        instance.my_method(10)
-        output = self._remove_ansi_escape_codes(self.mock_stdout.getvalue())
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            instance.my_method(10)
+        output = self._remove_ansi_escape_codes(buf.getvalue())
 
         # Check that the backtrace shows `my_method(self, x=10)` and not the value of self
         self.assertIn("my_method(self, x=10)", output)
         self.assertNotIn("MyClass object", output)
 
     def test_dprint_hide_wrappers(self):
-        import functools
-
         def simple_decorator(f):
             @functools.wraps(f)
             def wrapper(*args, **kwargs):
@@ -133,20 +214,40 @@ class TestDprint(unittest.TestCase):
         def wrapped_function():
             dprint(hide_wrappers=True)
 
-        wrapped_function()
-        output = self._remove_ansi_escape_codes(self.mock_stdout.getvalue())
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            wrapped_function()
+        output = self._remove_ansi_escape_codes(buf.getvalue())
         self.assertNotIn("wrapper()", output)
         self.assertIn("wrapped_function()", output)
 
-        # Reset stdout
-        self.mock_stdout = io.StringIO()
-        sys.stdout = self.mock_stdout
-
         @simple_decorator
         def wrapped_function_show():
             dprint(hide_wrappers=False)
 
-        wrapped_function_show()
-        output = self._remove_ansi_escape_codes(self.mock_stdout.getvalue())
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            wrapped_function_show()
+        output = self._remove_ansi_escape_codes(buf.getvalue())
         self.assertIn("wrapper()", output)
         self.assertIn("wrapped_function_show()", output)
+
+
+class TestFormatValue(unittest.TestCase):
+
+    def test_format_value_string(self):
+        self.assertIn("'short'", _format_plain("short"))
+        self.assertIn("'aaaaaaaaaaaaaaaaaaaaaaaaaaaaaa'+120", _format_plain("a" * 150))
+
+    def test_format_value_list(self):
+        self.assertIn("[1, 2, 3]", _format_plain([1, 2, 3]))
+        self.assertIn("[", _format_plain(list(range(100))))
+
+    def test_format_value_dict(self):
+        self.assertIn("{'a': 1}", _format_plain({"a": 1}))
+        self.assertIn("{'a': 1, 'b': 2}", _format_plain({"a": 1, "b": 2}))
+
+    def test_format_value_none_bool(self):
+        self.assertIn("None", _format_plain(None))
+        self.assertIn("True", _format_plain(True))
+        self.assertIn("False", _format_plain(False))